@@ -1,19 +1,37 @@
 """The Flogas integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
+import time
 from datetime import timedelta
 from typing import Any
-import urllib.parse
+from urllib.parse import unquote
 
 import aiohttp
 import voluptuous as vol
+from yarl import URL
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-
-from .const import DOMAIN
+from homeassistant.util.json import json_loads
+
+from .const import (
+    API_BASE_URL,
+    API_CSRF_URL,
+    API_CUSTOMER_URL,
+    API_DATA_URL,
+    API_GAUGE_URL,
+    API_LOGIN_URL,
+    CONF_EMAIL,
+    CONF_PASSWORD,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    MAX_SCAN_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,25 +46,69 @@ SERVICE_SUBMIT_GAUGE_SCHEMA = vol.Schema({
     ),
 })
 
-API_BASE_URL = "https://datalayer.flogas.co.uk"
-API_CSRF_URL = f"{API_BASE_URL}/sanctum/csrf-cookie"
-API_LOGIN_URL = f"{API_BASE_URL}/portal/customer/login"
-API_DATA_URL = f"{API_BASE_URL}/portal/bulk/data"
-API_CUSTOMER_URL = f"{API_BASE_URL}/portal/customer"
-API_GAUGE_URL = f"{API_BASE_URL}/portal/bulk/gauge"
+API_BASE = URL(API_BASE_URL)
+
+# Bound every request so a hung server fails the update instead of stalling it
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10, sock_read=15)
+
+# Transient failures worth retrying before giving up on a tank refresh
+RETRY_ATTEMPTS = 3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_MAX_DELAY = 30
+
+# Static request headers, copied and completed per request
+API_GET_HEADERS = {"Accept": "application/json"}
+API_POST_HEADERS = {**API_GET_HEADERS, "Content-Type": "application/json"}
+
+# Tank data keys as returned by the API, and the keys exposed to sensors
+TANK_API_KEYS = (
+    "remainingPercentage",
+    "daysRemaining",
+    "tankCapacity",
+    "lastGaugeReadingDate",
+)
+TANK_DATA_KEYS = (
+    "remaining_percentage",
+    "days_remaining",
+    "tank_capacity",
+    "last_reading_date",
+)
+
+# Stop polling a failing API for a while after repeated failed updates.
+# The cooldown must be longer than the normal update interval to matter.
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RECOVERY_TIMEOUT = timedelta(hours=3)
+# Home Assistant may fire a refresh a little before its nominal time, so wait
+# slightly longer than the cooldown to be sure the circuit has half opened
+CIRCUIT_RETRY_SLACK = timedelta(minutes=1)
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+def _retry_delay(attempt: int, retry_after: str | None = None) -> float:
+    """Return the delay before the next attempt, honouring Retry-After."""
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), RETRY_MAX_DELAY)
+    # Exponential backoff with full jitter
+    return random.uniform(0, min(RETRY_MAX_DELAY, 2**attempt))
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Flogas from a config entry."""
+    # Each account needs its own cookie jar for the Sanctum session, but the
+    # session runs on Home Assistant's shared connector and is closed by it.
     api = FlogasAPI(
-        entry.data["email"],
-        entry.data["password"],
+        entry.data[CONF_EMAIL],
+        entry.data[CONF_PASSWORD],
+        async_create_clientsession(hass),
     )
 
     coordinator = FlogasDataUpdateCoordinator(
         hass,
         api=api,
-        update_interval=timedelta(hours=1),
+        update_interval=DEFAULT_SCAN_INTERVAL,
     )
 
     await coordinator.async_config_entry_first_refresh()
@@ -94,154 +156,306 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 class FlogasAPI:
     """Flogas API client."""
 
-    def __init__(self, account_reference: str, password: str) -> None:
+    def __init__(
+        self,
+        account_reference: str,
+        password: str,
+        session: aiohttp.ClientSession,
+    ) -> None:
         """Initialize the API."""
         self._account_reference = account_reference
         self._password = password
+        self._session = session
         self._token: str | None = None
-        self._session: aiohttp.ClientSession | None = None
-
-    async def _ensure_session(self) -> aiohttp.ClientSession:
-        """Ensure we have an aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
-        return self._session
+        self._bearer: str | None = None
+        self._xsrf_token: str | None = None
+        self._csrf_valid_until = 0.0
+        # URL -> (ETag, Last-Modified, parsed data) of the last full response
+        self._cached_responses: dict[str, tuple[str | None, str | None, dict[str, Any]]] = {}
+        self._auth_lock = asyncio.Lock()
+        # Bumped after every login attempt so waiters can reuse its result
+        self._login_generation = 0
+        self._login_result = False
+
+    async def _ensure_authenticated(self) -> None:
+        """Log in before a request if there is no token.
+
+        Sanctum tokens carry no expiry, so a token is only replaced once the
+        API rejects it.
+        """
+        if self._token is None and not await self.login():
+            raise UpdateFailed("Failed to log in to Flogas")
+
+    def _session_rejected(self, headers: dict[str, str], retry_auth: bool) -> None:
+        """Drop the token a rejected request used, or give up after one retry."""
+        if not retry_auth:
+            raise UpdateFailed("Flogas rejected the session again after logging in")
+
+        _LOGGER.debug("Session expired, attempting re-login")
+        # Keep a token that another request refreshed in the meantime
+        if self._bearer == headers.get("Authorization"):
+            self._token = None
+
+    def _build_auth_headers(self, content_type: bool = False) -> dict[str, str]:
+        """Build the headers for an authenticated API request."""
+        headers = (API_POST_HEADERS if content_type else API_GET_HEADERS).copy()
+        if self._bearer:
+            headers["Authorization"] = self._bearer
+        if self._xsrf_token:
+            headers["X-XSRF-TOKEN"] = self._xsrf_token
+        return headers
+
+    def _add_cache_validators(self, url: str, headers: dict[str, str]) -> None:
+        """Make a GET conditional on the last response for this URL."""
+        if cached := self._cached_responses.get(url):
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+    def _cache_response(
+        self, url: str, response: aiohttp.ClientResponse, data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Remember parsed data for URLs that send cache validators."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._cached_responses[url] = (etag, last_modified, data)
+        else:
+            self._cached_responses.pop(url, None)
+        return data
 
     async def login(self) -> bool:
         """Login to the Flogas API."""
-        session = await self._ensure_session()
-
-        # Get CSRF cookie
-        async with session.get(API_CSRF_URL) as response:
+        generation = self._login_generation
+        async with self._auth_lock:
+            # Another caller may have tried to log in while we were waiting,
+            # so don't repeat a login that has just failed
+            if self._login_generation != generation and not self._login_result:
+                return False
+            if self._token is not None:
+                return True
+            self._login_result = False
+            try:
+                self._login_result = await self._login()
+            finally:
+                self._login_generation += 1
+            return self._login_result
+
+    def _read_xsrf_cookie(self) -> str | None:
+        """Return the XSRF token currently held in the cookie jar."""
+        morsel = self._session.cookie_jar.filter_cookies(API_BASE).get("XSRF-TOKEN")
+        return unquote(morsel.value) if morsel else None
+
+    async def _fetch_csrf_token(self) -> bool:
+        """Fetch a new CSRF cookie and cache its XSRF token."""
+        session = self._session
+
+        async with session.get(API_CSRF_URL, timeout=REQUEST_TIMEOUT) as response:
             if response.status != 204:
                 _LOGGER.error("Failed to get CSRF cookie: %s", response.status)
                 return False
 
-        # Get XSRF token from cookies
-        xsrf_token = None
-        for cookie in session.cookie_jar:
-            if cookie.key == "XSRF-TOKEN":
-                xsrf_token = urllib.parse.unquote(cookie.value)
-                break
+            # The cookie jar drops cookie attributes, so read the lifetime here
+            sent = response.cookies.get("XSRF-TOKEN")
+            max_age = sent["max-age"] if sent else ""
 
-        if not xsrf_token:
+        # Get XSRF token from cookies, cached for subsequent requests
+        self._xsrf_token = self._read_xsrf_cookie()
+
+        if not self._xsrf_token:
             _LOGGER.error("No XSRF token found in cookies")
             return False
 
+        self._csrf_valid_until = (
+            time.monotonic() + int(max_age) if max_age.isdigit() else 0.0
+        )
+        return True
+
+    async def _login(self, refresh_csrf: bool = False) -> bool:
+        """Perform the CSRF handshake and login request."""
+        session = self._session
+
+        # The CSRF cookie outlives the API token, so reuse it while it is valid
+        if (
+            refresh_csrf
+            or self._xsrf_token is None
+            or time.monotonic() >= self._csrf_valid_until
+        ):
+            if not await self._fetch_csrf_token():
+                return False
+
         # Login
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "X-XSRF-TOKEN": xsrf_token,
-        }
+        headers = {**API_POST_HEADERS, "X-XSRF-TOKEN": self._xsrf_token}
         data = {
             "accountReference": self._account_reference,
             "password": self._password,
         }
 
-        async with session.post(API_LOGIN_URL, json=data, headers=headers) as response:
-            if response.status != 200:
-                result = await response.json()
-                _LOGGER.error("Login failed: %s", result)
-                return False
-
-            result = await response.json()
-            if result.get("success"):
-                self._token = result.get("response", {}).get("token")
-                _LOGGER.debug("Login successful, token: %s...", self._token[:20] if self._token else None)
-                return True
-            else:
-                _LOGGER.error("Login failed: %s", result)
-                return False
-
-    async def get_tank_data(self) -> dict[str, Any]:
-        """Get tank data from the API."""
-        session = await self._ensure_session()
+        async with session.post(
+            API_LOGIN_URL, json=data, headers=headers, timeout=REQUEST_TIMEOUT
+        ) as response:
+            status = response.status
+            body = await response.read()
 
-        headers = {
-            "Accept": "application/json",
-        }
-        if self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
+        # Retry with a fresh CSRF cookie once the rejected response is released
+        if status == 419 and not refresh_csrf:
+            _LOGGER.debug("CSRF token rejected, fetching a new one")
+            return await self._login(refresh_csrf=True)
 
-        # Get XSRF token for the request
-        for cookie in session.cookie_jar:
-            if cookie.key == "XSRF-TOKEN":
-                headers["X-XSRF-TOKEN"] = urllib.parse.unquote(cookie.value)
-                break
+        result = json_loads(body) if body else {}
 
-        async with session.get(API_DATA_URL, headers=headers) as response:
-            if response.status in [401, 403, 419]:
-                _LOGGER.debug("Session expired, attempting re-login")
-                await self.login()
-                return await self.get_tank_data()
+        if status == 200 and result.get("success"):
+            self._token = result.get("response", {}).get("token")
+            self._bearer = f"Bearer {self._token}" if self._token else None
+            # Laravel reissues XSRF-TOKEN on login and may rotate it
+            self._xsrf_token = self._read_xsrf_cookie() or self._xsrf_token
+            _LOGGER.debug("Login successful, token: %s...", self._token[:20] if self._token else None)
+            return True
 
-            if response.status != 200:
-                raise UpdateFailed(f"Error fetching data: {response.status}")
+        _LOGGER.error("Login failed: %s - %s", status, result)
+        return False
 
-            result = await response.json()
-
-            if not result.get("success"):
-                raise UpdateFailed(f"API error: {result}")
-
-            data = result.get("response", {})
-            return {
-                "remaining_percentage": data.get("remainingPercentage"),
-                "days_remaining": data.get("daysRemaining"),
-                "tank_capacity": data.get("tankCapacity"),
-                "last_reading_date": data.get("lastGaugeReadingDate"),
-            }
+    async def get_tank_data(self, retry_auth: bool = True) -> dict[str, Any]:
+        """Get tank data from the API."""
+        session = self._session
+
+        for attempt in range(1, RETRY_ATTEMPTS + 1):
+            # Another request may have logged in again while we were waiting
+            await self._ensure_authenticated()
+            headers = self._build_auth_headers()
+            self._add_cache_validators(API_DATA_URL, headers)
+
+            retry_after: str | None = None
+            try:
+                async with session.get(
+                    API_DATA_URL, headers=headers, timeout=REQUEST_TIMEOUT
+                ) as response:
+                    if response.status in [401, 403, 419]:
+                        break
+
+                    if response.status in RETRY_STATUSES and attempt < RETRY_ATTEMPTS:
+                        retry_after = response.headers.get("Retry-After")
+                    else:
+                        return await self._parse_tank_response(response)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as err:
+                if attempt == RETRY_ATTEMPTS:
+                    raise
+                _LOGGER.debug("Error fetching tank data, retrying: %s", err)
+
+            await asyncio.sleep(_retry_delay(attempt, retry_after))
+
+        # Only reached when the API rejected the session
+        self._session_rejected(headers, retry_auth)
+        return await self.get_tank_data(retry_auth=False)
+
+    async def _parse_tank_response(
+        self, response: aiohttp.ClientResponse
+    ) -> dict[str, Any]:
+        """Parse a tank data response."""
+        if response.status == 304 and API_DATA_URL in self._cached_responses:
+            return self._cached_responses[API_DATA_URL][2]
+
+        if response.status != 200:
+            raise UpdateFailed(f"Error fetching data: {response.status}")
+
+        result = json_loads(await response.read())
+
+        if not result.get("success"):
+            raise UpdateFailed(f"API error: {result}")
+
+        data = result.get("response", {})
+        return self._cache_response(
+            API_DATA_URL,
+            response,
+            dict(zip(TANK_DATA_KEYS, map(data.get, TANK_API_KEYS))),
+        )
 
-    async def get_customer_data(self) -> dict[str, Any]:
+    async def get_customer_data(self, retry_auth: bool = True) -> dict[str, Any]:
         """Get customer data including balance from the API."""
-        session = await self._ensure_session()
-
-        headers = {
-            "Accept": "application/json",
-        }
-        if self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
+        session = self._session
 
-        # Get XSRF token for the request
-        for cookie in session.cookie_jar:
-            if cookie.key == "XSRF-TOKEN":
-                headers["X-XSRF-TOKEN"] = urllib.parse.unquote(cookie.value)
-                break
+        await self._ensure_authenticated()
+        headers = self._build_auth_headers()
+        self._add_cache_validators(API_CUSTOMER_URL, headers)
 
-        async with session.get(API_CUSTOMER_URL, headers=headers) as response:
+        async with session.get(
+            API_CUSTOMER_URL, headers=headers, timeout=REQUEST_TIMEOUT
+        ) as response:
             if response.status in [401, 403, 419]:
-                _LOGGER.debug("Session expired, attempting re-login")
-                await self.login()
-                return await self.get_customer_data()
+                self._session_rejected(headers, retry_auth)
+                return await self.get_customer_data(retry_auth=False)
+
+            if response.status == 304 and API_CUSTOMER_URL in self._cached_responses:
+                return self._cached_responses[API_CUSTOMER_URL][2]
 
             if response.status != 200:
-                _LOGGER.warning("Error fetching customer data: %s", response.status)
-                return {}
+                raise UpdateFailed(f"Error fetching customer data: {response.status}")
 
-            result = await response.json()
+            result = json_loads(await response.read())
 
             if not result.get("success"):
-                _LOGGER.warning("Customer API error: %s", result)
-                return {}
+                raise UpdateFailed(f"Customer API error: {result}")
 
             customer = result.get("response", {}).get("customer", {})
-            return {
-                "balance": customer.get("balance"),
-            }
-
-    async def get_all_data(self) -> dict[str, Any]:
-        """Get all data from both tank and customer endpoints."""
-        tank_data = await self.get_tank_data()
-        customer_data = await self.get_customer_data()
-        
-        # Merge the data
-        return {**tank_data, **customer_data}
-
-    async def submit_gauge_reading(self, reading: int) -> dict[str, Any]:
+            return self._cache_response(
+                API_CUSTOMER_URL,
+                response,
+                {
+                    "balance": customer.get("balance"),
+                },
+            )
+
+    async def get_all_data(
+        self, previous: dict[str, Any] | None = None
+    ) -> tuple[dict[str, Any], bool]:
+        """Get all data from both tank and customer endpoints.
+
+        Args:
+            previous: Data from the last successful update, kept for any
+                endpoint that fails this time.
+
+        Returns:
+            Merged tank and customer data, and whether the tank data was
+            fetched rather than carried over from the previous update.
+        """
+        tank_data, customer_data = await asyncio.gather(
+            self.get_tank_data(),
+            self.get_customer_data(),
+            return_exceptions=True,
+        )
+
+        for result in (tank_data, customer_data):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+
+        # Tank data is the core of the integration, so without it or an
+        # earlier update to fall back on there is nothing worth publishing
+        if isinstance(tank_data, BaseException) and (
+            not previous or isinstance(customer_data, BaseException)
+        ):
+            if isinstance(tank_data, UpdateFailed):
+                raise tank_data
+            raise UpdateFailed(f"Error fetching data: {tank_data}") from tank_data
+
+        # Merge whatever data was fetched successfully over the last update
+        data: dict[str, Any] = dict(previous or {})
+        for result in (tank_data, customer_data):
+            if isinstance(result, BaseException):
+                _LOGGER.warning("Partial data update, request failed: %s", result)
+                continue
+            data.update(result)
+        return data, not isinstance(tank_data, BaseException)
+
+    async def submit_gauge_reading(
+        self, reading: int, retry_auth: bool = True
+    ) -> dict[str, Any]:
         """Submit a tank gauge reading to Flogas.
 
         Args:
             reading: Tank level as a percentage (0-100).
+            retry_auth: Log in again and retry once if the session is rejected.
 
         Returns:
             API response dict with success status.
@@ -249,30 +463,21 @@ class FlogasAPI:
         if not 0 <= reading <= 100:
             raise ValueError("Reading must be between 0 and 100")
 
-        session = await self._ensure_session()
+        session = self._session
 
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
-        if self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
-
-        # Get XSRF token for the request
-        for cookie in session.cookie_jar:
-            if cookie.key == "XSRF-TOKEN":
-                headers["X-XSRF-TOKEN"] = urllib.parse.unquote(cookie.value)
-                break
+        await self._ensure_authenticated()
+        headers = self._build_auth_headers(content_type=True)
 
         data = {"reading": reading}
 
-        async with session.post(API_GAUGE_URL, json=data, headers=headers) as response:
+        async with session.post(
+            API_GAUGE_URL, json=data, headers=headers, timeout=REQUEST_TIMEOUT
+        ) as response:
             if response.status in [401, 403, 419]:
-                _LOGGER.debug("Session expired, attempting re-login")
-                await self.login()
-                return await self.submit_gauge_reading(reading)
+                self._session_rejected(headers, retry_auth)
+                return await self.submit_gauge_reading(reading, retry_auth=False)
 
-            result = await response.json()
+            result = json_loads(await response.read())
 
             if response.status != 200:
                 _LOGGER.error("Gauge submission failed: %s - %s", response.status, result)
@@ -285,10 +490,44 @@ class FlogasAPI:
             _LOGGER.info("Successfully submitted gauge reading: %d%%", reading)
             return {"success": True, "response": result.get("response", {})}
 
-    async def close(self) -> None:
-        """Close the session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+
+class CircuitBreaker:
+    """Short-circuit calls to a backend that keeps failing."""
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        recovery_timeout: timedelta = CIRCUIT_RECOVERY_TIMEOUT,
+    ) -> None:
+        """Initialize the circuit breaker."""
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout.total_seconds()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self.last_error: Exception | None = None
+
+    @property
+    def state(self) -> str:
+        """Return the current state of the circuit."""
+        if self._opened_at is None:
+            return CIRCUIT_CLOSED
+        if time.monotonic() - self._opened_at >= self._recovery_timeout:
+            return CIRCUIT_HALF_OPEN
+        return CIRCUIT_OPEN
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        self._failures = 0
+        self._opened_at = None
+        self.last_error = None
+
+    def record_failure(self, err: Exception) -> None:
+        """Count a failed call, opening the circuit when needed."""
+        self._failures += 1
+        self.last_error = err
+        # A failed trial call while half open re-opens the circuit straight away
+        if self.state == CIRCUIT_HALF_OPEN or self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
 
 
 class FlogasDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -302,6 +541,9 @@ class FlogasDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     ) -> None:
         """Initialize coordinator."""
         self.api = api
+        self._base_interval = update_interval
+        self._last_reading: str | None = None
+        self._circuit = CircuitBreaker()
 
         super().__init__(
             hass,
@@ -310,6 +552,41 @@ class FlogasDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=update_interval,
         )
 
+    def _record_failure(self, err: Exception) -> None:
+        """Count a failed update against the circuit breaker."""
+        self._circuit.record_failure(err)
+        if self._circuit.state == CIRCUIT_OPEN:
+            # Schedule the next poll for when the circuit allows a trial call
+            self.update_interval = max(
+                self.update_interval, CIRCUIT_RECOVERY_TIMEOUT + CIRCUIT_RETRY_SLACK
+            )
+
     async def _async_update_data(self) -> dict:
         """Fetch data from API."""
-        return await self.api.get_all_data()
+        if self._circuit.state == CIRCUIT_OPEN:
+            raise UpdateFailed(f"Circuit open after repeated failures: {self._circuit.last_error}")
+
+        try:
+            data, tank_fetched = await self.api.get_all_data(self.data)
+        except Exception as err:
+            self._record_failure(err)
+            raise
+
+        if not tank_fetched:
+            # Publish the fresh customer data, but the tank refresh still failed
+            self._record_failure(UpdateFailed("Tank data was not updated"))
+            return data
+
+        if self._circuit.state != CIRCUIT_CLOSED:
+            self.update_interval = self._base_interval
+        self._circuit.record_success()
+
+        # Tank levels change over days, so back off while no new reading arrives
+        reading = data.get("last_reading_date")
+        if reading is not None and reading == self._last_reading:
+            self.update_interval = min(self.update_interval * 2, MAX_SCAN_INTERVAL)
+        else:
+            self.update_interval = self._base_interval
+        self._last_reading = reading
+
+        return data
@@ -9,6 +9,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
 from .const import DOMAIN
 from . import FlogasAPI
@@ -35,11 +36,18 @@ class FlogasConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            api = FlogasAPI(user_input[CONF_EMAIL], user_input[CONF_PASSWORD])
+            # A short-lived session with its own cookie jar, so Flogas
+            # cookies never land in Home Assistant's shared jar. Sessions
+            # created without auto cleanup must be detached when done.
+            session = async_create_clientsession(self.hass, auto_cleanup=False)
+            api = FlogasAPI(
+                user_input[CONF_EMAIL],
+                user_input[CONF_PASSWORD],
+                session,
+            )
             
             try:
                 await api.login()
-                await api.close()
                 
                 await self.async_set_unique_id(user_input[CONF_EMAIL].lower())
                 self._abort_if_unique_id_configured()
@@ -52,7 +60,7 @@ class FlogasConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.error("Failed to authenticate with Flogas: %s", err)
                 errors["base"] = "invalid_auth"
             finally:
-                await api.close()
+                session.detach()
 
         return self.async_show_form(
             step_id="user",
@@ -73,7 +81,15 @@ class FlogasConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            api = FlogasAPI(user_input[CONF_EMAIL], user_input[CONF_PASSWORD])
+            # A short-lived session with its own cookie jar, so Flogas
+            # cookies never land in Home Assistant's shared jar. Sessions
+            # created without auto cleanup must be detached when done.
+            session = async_create_clientsession(self.hass, auto_cleanup=False)
+            api = FlogasAPI(
+                user_input[CONF_EMAIL],
+                user_input[CONF_PASSWORD],
+                session,
+            )
             
             try:
                 await api.login()
@@ -90,7 +106,7 @@ class FlogasConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             except Exception:
                 errors["base"] = "invalid_auth"
             finally:
-                await api.close()
+                session.detach()
 
         return self.async_show_form(
             step_id="reauth_confirm",
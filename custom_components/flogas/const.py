@@ -9,12 +9,15 @@ CONF_PASSWORD = "password"
 
 # API URLs - Laravel Sanctum authentication pattern
 API_BASE_URL = "https://datalayer.flogas.co.uk"
-CSRF_COOKIE_URL = f"{API_BASE_URL}/sanctum/csrf-cookie"
-LOGIN_URL = f"{API_BASE_URL}/portal/customer/login"
+API_CSRF_URL = f"{API_BASE_URL}/sanctum/csrf-cookie"
+API_LOGIN_URL = f"{API_BASE_URL}/portal/customer/login"
 API_DATA_URL = f"{API_BASE_URL}/portal/bulk/data"
+API_CUSTOMER_URL = f"{API_BASE_URL}/portal/customer"
+API_GAUGE_URL = f"{API_BASE_URL}/portal/bulk/gauge"
 
 # Defaults
 DEFAULT_SCAN_INTERVAL = timedelta(hours=1)
+MAX_SCAN_INTERVAL = timedelta(hours=6)
 
 # User agent
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -1,6 +1,7 @@
 """Sensor platform for Flogas integration."""
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -13,6 +14,7 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfVolume
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -70,6 +72,19 @@ SENSOR_TYPES: tuple[FlogasSensorEntityDescription, ...] = (
 )
 
 
+def _tank_level_attributes(data: dict[str, Any]) -> dict[str, Any]:
+    """Return the extra state attributes of the tank level sensor."""
+    return {
+        "last_reading_date": data.get("last_reading_date"),
+        "tank_capacity_litres": data.get("tank_capacity"),
+    }
+
+
+EXTRA_ATTRIBUTES_BUILDERS: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    "tank_level": _tank_level_attributes,
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -78,8 +93,15 @@ async def async_setup_entry(
     """Set up Flogas sensors based on a config entry."""
     coordinator: FlogasDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    # All sensors of an entry belong to the same device, so share one dict
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name="Flogas Tank",
+        manufacturer="Flogas",
+    )
+
     async_add_entities(
-        FlogasSensor(coordinator, description, entry)
+        FlogasSensor(coordinator, description, entry, device_info)
         for description in SENSOR_TYPES
     )
 
@@ -95,30 +117,33 @@ class FlogasSensor(CoordinatorEntity[FlogasDataUpdateCoordinator], SensorEntity)
         coordinator: FlogasDataUpdateCoordinator,
         description: FlogasSensorEntityDescription,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
+        self._value_key = description.value_key
+        self._attrs_builder = EXTRA_ATTRIBUTES_BUILDERS.get(description.key)
+        self._attrs_data: dict[str, Any] | None = None
+        self._attrs: dict[str, Any] = {}
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "Flogas Tank",
-            "manufacturer": "Flogas",
-        }
+        self._attr_device_info = device_info
 
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        if self.coordinator.data is None:
-            return None
-        return self.coordinator.data.get(self.entity_description.value_key)
+        data = self.coordinator.data
+        return data.get(self._value_key) if data else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        if self.entity_description.key == "tank_level":
-            return {
-                "last_reading_date": self.coordinator.data.get("last_reading_date") if self.coordinator.data else None,
-                "tank_capacity_litres": self.coordinator.data.get("tank_capacity") if self.coordinator.data else None,
-            }
-        return {}
+        if self._attrs_builder is None:
+            return {}
+
+        # Rebuild only when the coordinator has delivered new data
+        data = self.coordinator.data
+        if data is not self._attrs_data:
+            self._attrs_data = data
+            self._attrs = self._attrs_builder(data or {})
+        return self._attrs